@@ -0,0 +1,710 @@
+"""
+Bevy Material UI - Docs Screenshot Capture
+==========================================
+
+Captures one screenshot per showcase section for the component pages in
+docs/components/. Navigation and readiness detection are telemetry-driven:
+instead of fixed sleeps, the script polls telemetry.json for the expected
+`selected_section` state and waits for the rendered frame to settle before
+capturing.
+
+Usage:
+    python capture_docs.py                   # capture every section
+    python capture_docs.py --section button  # capture a single section
+    python capture_docs.py --no-crop         # keep the sidebar/top bar
+    python capture_docs.py --no-start        # reuse an already-running showcase
+    python capture_docs.py --daemon          # serve captures for fast --section runs
+
+Dependencies are listed in tests/ui_tests/requirements.txt; install them once
+with `pip install -r tests/ui_tests/requirements.txt`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import hashlib
+import io
+import json
+import os
+import queue
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+# No auto-install on import failure: a surprise `pip install` blocks the run
+# and does network I/O in CI. Install once from requirements.txt instead.
+# quick_test sits inside the guard too — it pulls in visual_diff and the rest
+# of the harness stack, so its transitive imports fail the same friendly way.
+try:
+    import mss
+    import pyautogui
+    from PIL import Image
+
+    from quick_test import (
+        TELEMETRY_FILE,
+        WORKSPACE_DIR,
+        click_element,
+        click_nav_element_with_auto_scroll,
+        read_telemetry,
+        scroll_sidebar_to_top,
+        set_window_bounds,
+        wait_for_bevy_window,
+        wait_for_telemetry_update,
+    )
+except ImportError:
+    print("Missing capture dependencies. Install them with:")
+    print("  pip install -r tests/ui_tests/requirements.txt")
+    sys.exit(2)
+
+pyautogui.FAILSAFE = False
+# No blanket post-call sleep (quick_test sets 0.1 at import; this runs after
+# and wins). Telemetry readiness polling is the correctness barrier here, and
+# a fixed pause per mouse primitive just stretches every navigation. Clicks
+# issued from this script likewise skip the post-click settle (settle=0.0 /
+# the auto-scroll nav path); the only fixed input delay left is safe_click's
+# short moveTo, kept so Bevy picking sees the hover before the press.
+pyautogui.PAUSE = 0.0
+
+DOCS_SCREENSHOTS_DIR = WORKSPACE_DIR / "docs" / "components" / "screenshots"
+
+# Content hashes of the last written screenshots, used to skip re-encoding
+# sections whose pixels did not change since the previous run.
+HASHES_FILE = DOCS_SCREENSHOTS_DIR / ".hashes.json"
+
+# Daemon mode speaks newline-delimited JSON over localhost TCP; the active
+# daemon publishes its port here so clients can find it. TCP rather than a
+# Unix socket because the window-discovery half of this harness is
+# Windows-only today.
+_RUNTIME_DIR = Path(os.environ.get("XDG_RUNTIME_DIR", tempfile.gettempdir()))
+PORTFILE_PATH = _RUNTIME_DIR / "bevy_material_ui_showcase.port"
+
+# Persistent native screen-grab handle (XShm/BitBlt/CGDisplayCreateImage);
+# created lazily because mss.mss() is where most of its setup cost lives.
+_sct: mss.base.MSSBase | None = None
+
+
+def _grab_raw(bbox) -> "mss.screenshot.ScreenShot":
+    """Grab a screen region via the shared mss handle.
+
+    mss keeps a reusable native capture context and pixel buffer across
+    calls, so a grab is a single blit into already-mapped memory instead of
+    the full screenshot-tool round trip ImageGrab does. The returned BGRA
+    buffer is only valid until the next grab.
+    """
+    global _sct
+    if _sct is None:
+        _sct = mss.mss()
+    return _sct.grab({
+        "left": bbox[0],
+        "top": bbox[1],
+        "width": bbox[2] - bbox[0],
+        "height": bbox[3] - bbox[1],
+    })
+
+
+def _grab(bbox) -> Image.Image:
+    """Grab a screen region as a PIL image.
+
+    Decoding straight from the BGRA buffer ("raw"/"BGRX") makes the one
+    required copy inside PIL's C decoder; going through ScreenShot.rgb would
+    add a Python-level channel swizzle and a second bytes object first.
+    """
+    raw = _grab_raw(bbox)
+    return Image.frombytes("RGB", raw.size, raw.raw, "raw", "BGRX")
+
+
+# Image encoding happens off the capture thread so the next navigation can
+# start while the previous section is still compressing. Image.save releases
+# the GIL inside libwebp, so threads (not processes) are enough to overlap
+# the work.
+_encoder = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+# (nav test_id, docs page stem, telemetry selected_section value)
+SECTIONS: list[tuple[str, str, str]] = [
+    ("nav_buttons", "button", "Buttons"),
+    ("nav_checkboxes", "checkbox", "Checkboxes"),
+    ("nav_switches", "switch", "Switches"),
+    ("nav_radio_buttons", "radio", "RadioButtons"),
+    ("nav_chips", "chip", "Chips"),
+    ("nav_fab", "fab", "FAB"),
+    ("nav_progress", "progress", "Progress"),
+    ("nav_cards", "card", "Cards"),
+    ("nav_dividers", "divider", "Dividers"),
+    ("nav_lists", "list", "Lists"),
+    ("nav_icon_buttons", "icon_button", "IconButtons"),
+    ("nav_sliders", "slider", "Sliders"),
+    ("nav_text_fields", "text_field", "TextFields"),
+    ("nav_dialogs", "dialog", "Dialogs"),
+    ("nav_menus", "menu", "Menus"),
+    ("nav_tabs", "tabs", "Tabs"),
+    ("nav_select", "select", "Select"),
+    ("nav_snackbar", "snackbar", "Snackbar"),
+    ("nav_tooltips", "tooltip", "Tooltips"),
+    ("nav_toolbar", "toolbar", "Toolbar"),
+]
+
+# Reverse index for --section lookups, keyed by both the docs page stem and
+# the case-folded display name.
+_LOOKUP: dict[str, tuple[str, str, str]] = {}
+for _entry in SECTIONS:
+    _LOOKUP[_entry[1]] = _entry
+    _LOOKUP[_entry[2].lower()] = _entry
+
+
+def ensure_output_dir() -> None:
+    DOCS_SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    print(f"Output directory: {DOCS_SCREENSHOTS_DIR}")
+
+
+def _showcase_source_mtime() -> float:
+    """Newest mtime across the inputs the showcase binary is built from."""
+    newest = 0.0
+    for root in (WORKSPACE_DIR / "examples", WORKSPACE_DIR / "src"):
+        for path in root.rglob("*.rs"):
+            newest = max(newest, path.stat().st_mtime)
+    lock = WORKSPACE_DIR / "Cargo.lock"
+    if lock.exists():
+        newest = max(newest, lock.stat().st_mtime)
+    return newest
+
+
+def build_showcase() -> Path:
+    """Build the showcase example in release mode and return the binary path.
+
+    Skips cargo entirely when the binary is newer than every .rs source and
+    Cargo.lock — even a no-op `cargo build` pays the dependency-graph scan.
+    """
+    exe_name = "showcase.exe" if os.name == "nt" else "showcase"
+    exe = WORKSPACE_DIR / "target" / "release" / "examples" / exe_name
+
+    try:
+        bin_mtime = exe.stat().st_mtime
+    except FileNotFoundError:
+        bin_mtime = 0.0
+
+    if bin_mtime >= _showcase_source_mtime():
+        return exe
+
+    print("Building showcase (release)...")
+    subprocess.run(
+        ["cargo", "build", "--example", "showcase", "--release"],
+        cwd=WORKSPACE_DIR,
+        check=True,
+    )
+    return exe
+
+
+def start_showcase() -> subprocess.Popen:
+    """Launch the showcase with telemetry enabled and wait until it is live.
+
+    Runs the pre-built example binary directly instead of `cargo run`, so
+    repeated captures skip cargo's dependency-graph walk and relink entirely.
+    Readiness is detected by polling telemetry.json for element data rather
+    than sleeping a fixed amount after spawn.
+    """
+    exe = build_showcase()
+
+    if TELEMETRY_FILE.exists():
+        TELEMETRY_FILE.unlink()
+
+    env = os.environ.copy()
+    env["BEVY_TELEMETRY"] = "1"
+
+    print("Starting Bevy showcase...")
+    # Spawn into its own process group/session so shutdown can signal the
+    # whole tree (see stop_showcase).
+    spawn_kwargs: dict = {}
+    if os.name == "nt":
+        spawn_kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        spawn_kwargs["start_new_session"] = True
+    process = subprocess.Popen(
+        [str(exe)],
+        cwd=WORKSPACE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **spawn_kwargs,
+    )
+
+    start = time.time()
+    while time.time() - start < 60.0:
+        telemetry = read_telemetry()
+        if telemetry and telemetry.get("elements"):
+            return process
+        if process.poll() is not None:
+            raise RuntimeError(f"showcase exited early with code {process.returncode}")
+        time.sleep(0.25)
+
+    raise RuntimeError("showcase did not publish telemetry within 60s")
+
+
+# Last known window placement. Enumerating windows is an OS round trip, so
+# repeat lookups within the staleness window reuse the cached rect; the
+# showcase never moves on its own once maximized.
+_window_cache: dict = {"client_origin": None, "rect": None, "ts": 0.0}
+
+
+def wait_for_window(process: subprocess.Popen | None, max_age: float = 30.0):
+    """Wait for the showcase window and register its bounds for click checks.
+
+    Returns (client_origin, window_rect) from the cache when it is fresher
+    than max_age; pass max_age=0 to force a re-query (e.g. after an explicit
+    window move/resize).
+    """
+    if _window_cache["rect"] is not None and time.time() - _window_cache["ts"] < max_age:
+        return _window_cache["client_origin"], _window_cache["rect"]
+
+    pid = process.pid if process else None
+    client_origin, window_rect = wait_for_bevy_window(timeout=20.0, maximize=True, pid=pid)
+    if not client_origin:
+        raise RuntimeError("showcase window not found")
+    set_window_bounds(window_rect, client_origin)
+
+    _window_cache["client_origin"] = client_origin
+    _window_cache["rect"] = window_rect
+    _window_cache["ts"] = time.time()
+    return client_origin, window_rect
+
+
+def wait_for_section_ready(display_name: str, timeout: float = 2.0) -> bool:
+    """Wait until telemetry shows the expected section as active.
+
+    Returns as soon as `selected_section` matches, typically well under 100ms
+    after the nav click lands; False only if the state never shows up. Each
+    iteration parks on a telemetry file-change event rather than a timed
+    sleep, so the wait is idle between writes.
+    """
+    deadline = time.time() + timeout
+    while True:
+        telemetry = read_telemetry()
+        if telemetry and telemetry.get("states", {}).get("selected_section") == display_name:
+            return True
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return False
+        wait_for_telemetry_update(min(remaining, 0.25))
+
+
+def wait_for_render_settled(bbox, timeout: float = 1.0, interval: float = 0.03) -> bool:
+    """Wait until two consecutive grabs of the region are pixel-identical.
+
+    Telemetry flips as soon as the section switches state-side; this confirms
+    the new section has actually finished painting (ripples faded, layout
+    settled) before we capture.
+    """
+    previous: bytes | None = None
+    start = time.time()
+    while time.time() - start < timeout:
+        # Compare the raw BGRA buffer directly — no PIL image and no channel
+        # conversion for a probe whose result is thrown away.
+        current = bytes(_grab_raw(bbox).raw)
+        if previous is not None and current == previous:
+            return True
+        previous = current
+        time.sleep(interval)
+    return False
+
+
+def navigate_to_section(nav_id: str, display_name: str, client_origin) -> bool:
+    """Click a sidebar nav item and wait for telemetry to confirm the switch.
+
+    The sidebar holds more items than fit in the viewport and telemetry
+    bounds are in scrolled/screen space, so a plain click_element would be
+    blocked for anything below the fold; the auto-scroll variant drags the
+    sidebar until the item is clickable.
+    """
+    print(f"\nNavigating to {display_name}...")
+    if not click_nav_element_with_auto_scroll(nav_id, client_origin):
+        print(f"  [MISS] {nav_id} not found")
+        return False
+
+    if not wait_for_section_ready(display_name):
+        print(f"  [FAIL] selected_section never became '{display_name}'")
+        return False
+    return True
+
+
+_section_hashes: dict[str, str] | None = None
+
+
+def _load_section_hashes() -> dict[str, str]:
+    global _section_hashes
+    if _section_hashes is None:
+        try:
+            _section_hashes = json.loads(HASHES_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            _section_hashes = {}
+    return _section_hashes
+
+
+def _save_section_hashes() -> None:
+    if _section_hashes is not None:
+        HASHES_FILE.write_text(json.dumps(_section_hashes, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def _encode_and_write(img: Image.Image, filepath: Path, section_id: str, digest: str) -> None:
+    """Encode to lossless WebP in memory, then write the file in one go.
+
+    Lossless WebP encodes several times faster than PNG and comes out
+    smaller on flat UI screenshots; method=0 is the fastest effort level.
+    Staging through BytesIO turns Image.save's incremental write loop into a
+    single write_bytes call per file. The section's content hash is recorded
+    only after the write lands, so interrupted runs re-encode next time.
+    """
+    buf = io.BytesIO()
+    img.save(buf, "WEBP", lossless=True, method=0, quality=100)
+    filepath.write_bytes(buf.getvalue())
+    _load_section_hashes()[section_id] = digest
+
+
+@dataclass(frozen=True)
+class CropGeometry:
+    """Screen-space region captured for docs screenshots.
+
+    Folding the sidebar/top-bar crop into the grab bbox lets the compositor
+    deliver exactly the region we keep — no second PIL buffer and no
+    Image.crop copy per section. Computed once per window; every section
+    shares the same geometry.
+    """
+
+    left: int
+    top: int
+    right: int
+    bottom: int
+
+    @classmethod
+    def for_window(cls, window_rect, crop_sidebar: bool = True) -> "CropGeometry":
+        left, top, right, bottom = window_rect
+        if crop_sidebar and right - left > 400:
+            sidebar_width = 280
+            top_bar_height = 60
+            return cls(left + sidebar_width, top + top_bar_height, right, bottom)
+        return cls(left, top, right, bottom)
+
+    @property
+    def bbox(self) -> tuple[int, int, int, int]:
+        return (self.left, self.top, self.right, self.bottom)
+
+
+def capture_cropped_section(bbox, section_id: str) -> concurrent.futures.Future:
+    """Capture the docs region of the current window.
+
+    The grab happens synchronously (it must see the current frame); the
+    encode is handed to the background encoder pool so the caller can move on
+    to the next section immediately. Returns the pending save future.
+    """
+    img = _grab(bbox)
+    filepath = DOCS_SCREENSHOTS_DIR / f"{section_id}.webp"
+
+    # Hashing the raw pixels is near-free next to the WebP encode it can
+    # save; incremental docs runs usually leave most sections untouched.
+    digest = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+    if _load_section_hashes().get(section_id) == digest and filepath.exists():
+        print(f"  Unchanged {filepath.name} (encode skipped)")
+        done: concurrent.futures.Future = concurrent.futures.Future()
+        done.set_result(None)
+        return done
+
+    future = _encoder.submit(_encode_and_write, img, filepath, section_id, digest)
+    print(f"  Saving {filepath.name} ({img.width}x{img.height})")
+    return future
+
+
+def _capture_worker(tasks: queue.Queue, pending: list[concurrent.futures.Future]) -> None:
+    """Consumer side of the capture pipeline.
+
+    Dequeues (bbox, section_id, grabbed, errors) items, waits for the frame
+    to settle, grabs it, and hands the encode to the encoder pool. `grabbed`
+    is always set — even when the grab fails — so the producer never blocks
+    on a section that will not complete; failures are reported through
+    `errors`. A None item shuts the worker down.
+    """
+    while True:
+        item = tasks.get()
+        if item is None:
+            return
+        bbox, section_id, grabbed, errors = item
+        try:
+            wait_for_render_settled(bbox)
+            pending.append(capture_cropped_section(bbox, section_id))
+        except Exception as e:
+            errors.append(f"[FAIL] {section_id}: capture failed: {e}")
+        finally:
+            grabbed.set()
+
+
+def capture_all_sections(client_origin, geometry: CropGeometry) -> list[tuple[str, bool]]:
+    """Navigate through every section, capturing a docs screenshot for each.
+
+    Navigation (pyautogui input) stays on the main thread; settle detection,
+    grab, and encode run on a worker so consecutive sections overlap. The
+    queue depth is 1 and each item carries a grabbed-barrier, so the next
+    click can never land before the previous frame was captured.
+    """
+    ensure_output_dir()
+    bbox = geometry.bbox
+
+    # Start from a known scroll position; auto-scroll handles the rest as the
+    # run walks down the sidebar.
+    scroll_sidebar_to_top(client_origin)
+
+    results: list[tuple[str, bool]] = []
+    pending: list[concurrent.futures.Future] = []
+    tasks: queue.Queue = queue.Queue(maxsize=1)
+    worker = threading.Thread(target=_capture_worker, args=(tasks, pending), daemon=True)
+    worker.start()
+
+    try:
+        for nav_id, section_id, display_name in SECTIONS:
+            if not navigate_to_section(nav_id, display_name, client_origin):
+                results.append((section_id, False))
+                continue
+
+            grabbed = threading.Event()
+            errors: list[str] = []
+            try:
+                # Bounded so a dead consumer surfaces as a failure instead of
+                # blocking the run forever.
+                tasks.put((bbox, section_id, grabbed, errors), timeout=10.0)
+            except queue.Full:
+                print(f"  [FAIL] {section_id}: capture worker stopped draining the queue")
+                results.append((section_id, False))
+                break
+
+            if not grabbed.wait(timeout=5.0):
+                print(f"  [FAIL] {section_id}: frame grab timed out")
+                results.append((section_id, False))
+                if not worker.is_alive():
+                    break
+                continue
+
+            if errors:
+                for message in errors:
+                    print(f"  {message}")
+                results.append((section_id, False))
+                continue
+
+            results.append((section_id, True))
+    finally:
+        try:
+            tasks.put(None, timeout=5.0)
+        except queue.Full:
+            pass
+        worker.join(timeout=10.0)
+
+    # Drain the encoder before reporting so failures surface and files exist.
+    concurrent.futures.wait(pending)
+    for future in pending:
+        future.result()
+    _save_section_hashes()
+
+    captured = sum(1 for _, ok in results if ok)
+    print(f"\nCaptured {captured}/{len(results)} sections")
+    for section_id, ok in results:
+        if not ok:
+            print(f"  [FAIL] {section_id}")
+    return results
+
+
+def capture_single_section(section_name: str, client_origin, geometry: CropGeometry) -> bool:
+    """Capture one section by docs page stem or display name."""
+    entry = _LOOKUP.get(section_name) or _LOOKUP.get(section_name.lower())
+    if not entry:
+        print(f"Unknown section '{section_name}'. Valid sections:")
+        for _, section_id, display_name in SECTIONS:
+            print(f"  {section_id} ({display_name})")
+        return False
+
+    nav_id, section_id, display_name = entry
+    ensure_output_dir()
+    scroll_sidebar_to_top(client_origin)
+    if not navigate_to_section(nav_id, display_name, client_origin):
+        return False
+    wait_for_render_settled(geometry.bbox)
+    capture_cropped_section(geometry.bbox, section_id).result()
+    _save_section_hashes()
+    return True
+
+
+def stop_showcase(process: subprocess.Popen | None) -> None:
+    """Shut the showcase down gracefully, escalating only if needed.
+
+    An interrupt gives winit its clean exit path (usually well under a
+    second); signalling the whole group also reaps anything the showcase
+    spawned, so reruns never fight an orphaned instance.
+    """
+    if not process or process.poll() is not None:
+        return
+
+    try:
+        if os.name == "nt":
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(os.getpgid(process.pid), signal.SIGINT)
+        process.wait(timeout=1)
+        return
+    except (subprocess.TimeoutExpired, ProcessLookupError, OSError):
+        pass
+
+    process.terminate()
+    try:
+        process.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+
+def _handle_daemon_command(request: dict, process: subprocess.Popen) -> dict:
+    """Execute one daemon command and build its JSON reply."""
+    cmd = request.get("cmd")
+
+    if cmd == "ping":
+        return {"ok": True}
+    if cmd == "nav":
+        client_origin, _ = wait_for_window(process)
+        return {"ok": bool(click_element(request.get("target", ""), client_origin, settle=0.0))}
+    if cmd == "capture":
+        client_origin, window_rect = wait_for_window(process)
+        geometry = CropGeometry.for_window(window_rect, crop_sidebar=request.get("crop", True))
+        return {"ok": capture_single_section(request.get("section", ""), client_origin, geometry)}
+    if cmd == "shutdown":
+        return {"ok": True, "shutdown": True}
+    return {"ok": False, "error": f"unknown cmd '{cmd}'"}
+
+
+def _connect_to_daemon() -> socket.socket | None:
+    """Connect to a running daemon via its port file, or None if unreachable.
+
+    A stale port file (daemon crashed without cleanup) just fails the
+    connect, so callers fall back to a fresh launch without special casing.
+    """
+    try:
+        port = int(PORTFILE_PATH.read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return None
+    try:
+        return socket.create_connection(("127.0.0.1", port), timeout=30.0)
+    except OSError:
+        return None
+
+
+def run_daemon() -> int:
+    """Keep the showcase alive and serve capture commands over localhost TCP.
+
+    Docs authors iterating on one section pay full showcase startup per
+    capture otherwise; against a daemon, `--section X` is a socket round
+    trip. Protocol: newline-delimited JSON, e.g. {"cmd": "capture",
+    "section": "button"}. Single instance is enforced by probing the port
+    file before binding.
+    """
+    existing = _connect_to_daemon()
+    if existing is not None:
+        existing.close()
+        print(f"Daemon already running (port file {PORTFILE_PATH})")
+        return 1
+
+    process = start_showcase()
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        wait_for_window(process)
+
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+        PORTFILE_PATH.write_text(str(port), encoding="utf-8")
+        print(f"Daemon listening on 127.0.0.1:{port} (port file {PORTFILE_PATH})")
+
+        while True:
+            conn, _ = server.accept()
+            shutdown = False
+            with conn:
+                stream = conn.makefile("rwb")
+                for line in stream:
+                    try:
+                        request = json.loads(line)
+                        reply = _handle_daemon_command(request, process)
+                    except (json.JSONDecodeError, RuntimeError) as e:
+                        reply = {"ok": False, "error": str(e)}
+                    stream.write(json.dumps(reply).encode() + b"\n")
+                    stream.flush()
+                    if reply.get("shutdown"):
+                        shutdown = True
+                        break
+            if shutdown:
+                return 0
+    finally:
+        server.close()
+        PORTFILE_PATH.unlink(missing_ok=True)
+        stop_showcase(process)
+
+
+def daemon_capture(section_name: str, crop_sidebar: bool = True) -> bool | None:
+    """Try to capture a section through a running daemon.
+
+    Returns the capture result, or None when no daemon is reachable (caller
+    falls back to a fresh showcase launch).
+    """
+    client = _connect_to_daemon()
+    if client is None:
+        return None
+
+    with client:
+        stream = client.makefile("rwb")
+        request = {"cmd": "capture", "section": section_name, "crop": crop_sidebar}
+        stream.write(json.dumps(request).encode() + b"\n")
+        stream.flush()
+        line = stream.readline()
+        if not line:
+            return None
+        reply = json.loads(line)
+        print(f"Captured '{section_name}' via daemon" if reply.get("ok") else
+              f"Daemon capture failed: {reply.get('error', 'see daemon log')}")
+        return bool(reply.get("ok"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Capture showcase screenshots for docs/components/")
+    parser.add_argument("--section", type=str, default="",
+                        help="Capture only this section (docs page stem, e.g. 'button')")
+    parser.add_argument("--no-crop", action="store_true",
+                        help="Keep the sidebar and top bar in the capture")
+    parser.add_argument("--no-start", action="store_true",
+                        help="Do not launch the showcase; attach to a running instance")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep the showcase alive and serve capture commands over a socket")
+    args = parser.parse_args()
+
+    if args.daemon:
+        return run_daemon()
+
+    # Single-section iteration goes through a running daemon when one is up,
+    # skipping showcase startup entirely.
+    if args.section and not args.no_start:
+        result = daemon_capture(args.section, crop_sidebar=not args.no_crop)
+        if result is not None:
+            return 0 if result else 1
+
+    process = None if args.no_start else start_showcase()
+    try:
+        client_origin, window_rect = wait_for_window(process)
+        geometry = CropGeometry.for_window(window_rect, crop_sidebar=not args.no_crop)
+
+        if args.section:
+            ok = capture_single_section(args.section, client_origin, geometry)
+            return 0 if ok else 1
+
+        results = capture_all_sections(client_origin, geometry)
+        return 0 if all(ok for _, ok in results) else 1
+    finally:
+        stop_showcase(process)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
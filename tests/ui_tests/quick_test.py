@@ -10,6 +10,7 @@ Includes visual regression testing via screenshot comparison.
 from __future__ import annotations
 
 import subprocess
+import threading
 import time
 import sys
 import json
@@ -18,17 +19,28 @@ from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass
 
+# No auto-install on import failure — a surprise `pip install` blocks the
+# run and does network I/O in CI. Install once from requirements.txt instead.
 try:
     import pyautogui
     from PIL import ImageGrab
 except ImportError:
-    subprocess.run([sys.executable, "-m", "pip", "install", "pyautogui", "pillow", "numpy"], check=True)
-    import pyautogui
-    from PIL import ImageGrab
+    print("Missing test dependencies. Install them with:")
+    print("  pip install -r tests/ui_tests/requirements.txt")
+    sys.exit(2)
 
 # Import our visual diff module
 from visual_diff import compare_with_baseline, generate_report, save_baseline
 
+# Optional: kernel file-watch support for telemetry waits. Without watchdog
+# the waits below degrade to short sleeps.
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
 pyautogui.FAILSAFE = False
 pyautogui.PAUSE = 0.1
 
@@ -633,6 +645,54 @@ def read_telemetry(max_retries: int = 3):
     return None
 
 
+class _TelemetryWatchHandler(FileSystemEventHandler):
+    """Sets an Event whenever telemetry.json is rewritten."""
+
+    def __init__(self):
+        self.updated = threading.Event()
+
+    def on_modified(self, event):
+        if Path(getattr(event, "src_path", "")).name == TELEMETRY_FILE.name:
+            self.updated.set()
+
+    on_created = on_modified
+
+
+_telemetry_watch: _TelemetryWatchHandler | None = None
+
+
+def _ensure_telemetry_watch() -> _TelemetryWatchHandler | None:
+    """Start (once) a file-system watch on telemetry.json's directory."""
+    global _telemetry_watch
+    if Observer is None:
+        return None
+    if _telemetry_watch is None:
+        handler = _TelemetryWatchHandler()
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(handler, str(TELEMETRY_FILE.parent))
+        observer.start()
+        _telemetry_watch = handler
+    return _telemetry_watch
+
+
+def wait_for_telemetry_update(timeout: float = 0.25) -> bool:
+    """Block until telemetry.json changes on disk, or timeout elapses.
+
+    With watchdog installed this parks on a kernel event (inotify /
+    ReadDirectoryChangesW / FSEvents) and costs no CPU while waiting.
+    Callers should re-read telemetry after every wake and keep their own
+    deadline: a write landing between their read and this wait is missed by
+    the event, which is why the default timeout stays short.
+    """
+    watch = _ensure_telemetry_watch()
+    if watch is None:
+        time.sleep(min(timeout, 0.02))
+        return True
+    watch.updated.clear()
+    return watch.updated.wait(timeout)
+
+
 def wait_for_telemetry_state(key: str, expected_value: str, timeout: float = 2.0) -> bool:
     """Wait until telemetry shows expected state"""
     start = time.time()
@@ -902,9 +962,11 @@ def is_element_clickable(test_id: str, click_pos) -> bool:
     return bool(valid)
 
 
-def click_element(test_id: str, window_rect=None) -> bool:
+def click_element(test_id: str, window_rect=None, settle: float = 0.3) -> bool:
     """Click an element by its test_id using bounds from telemetry.
-    Uses safe_click to prevent clicking outside the application."""
+    Uses safe_click to prevent clicking outside the application.
+    `settle` is the post-click pause; callers that verify the click's effect
+    through telemetry polling should pass 0.0."""
     bounds = get_element_bounds(test_id)
     if not bounds:
         print(f"  [MISS] Element '{test_id}' not found in telemetry")
@@ -927,8 +989,9 @@ def click_element(test_id: str, window_rect=None) -> bool:
     # Use safe_click to prevent clicking outside window
     if not safe_click(center_x, center_y, f"click element '{test_id}'"):
         return False
-    
-    time.sleep(0.3)
+
+    if settle > 0:
+        time.sleep(settle)
     return True
 
 